@@ -0,0 +1,68 @@
+"""Accuracy and throughput of the slope kernel modes on survey-scale coordinates.
+
+Run with ``python benchmarks/bench_slope_kernel.py [--points N] [--repeat R]``.
+Stations are generated on an integer millimetre grid around a 4,000,000 m
+northing so the exact slopes can be computed from integer differences.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from slope_kernel import profile_slopes  # noqa: E402
+
+MODES = (
+    ("float64", {"precision": "float64", "recenter": False}),
+    ("float64 + recenter", {"precision": "float64", "recenter": True}),
+    ("float32", {"precision": "float32", "recenter": False}),
+    ("float32 + recenter", {"precision": "float32", "recenter": True}),
+    ("float32 + compensated", {"precision": "float32", "recenter": False, "compensated": True}),
+    ("float32 + both", {"precision": "float32", "recenter": True, "compensated": True}),
+)
+
+
+def make_profile(points, seed=0):
+    """Return float64 chainage/elevation in metres and the exact slope percentages."""
+    rng = np.random.default_rng(seed)
+    run_mm = rng.integers(1, 2000, points - 1)
+    rise_mm = rng.integers(-150, 150, points - 1)
+    chainage_mm = 4_000_000_000 + np.concatenate([[0], np.cumsum(run_mm)])
+    elevation_mm = 850_000 + np.concatenate([[0], np.cumsum(rise_mm)])
+    exact = rise_mm / run_mm * 100
+    return chainage_mm / 1000, elevation_mm / 1000, exact
+
+
+def best_time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    chainage, elevation, exact = make_profile(args.points)
+    print(f"{'mode':<24}{'max abs err (%)':>18}{'max rel err':>14}{'Mpts/s':>10}")
+    for label, options in MODES:
+        slopes = profile_slopes(chainage, elevation, **options)
+        error = np.abs(slopes.astype(np.float64) - exact)
+        relative = error / np.maximum(np.abs(exact), 1e-12)
+        seconds = best_time(lambda: profile_slopes(chainage, elevation, **options), args.repeat)
+        throughput = args.points / seconds / 1e6
+        print(f"{label:<24}{np.nanmax(error):>18.3e}{np.nanmax(relative):>14.3e}{throughput:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
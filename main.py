@@ -1,11 +1,15 @@
 """Application entry point for the slope calculator GUI."""
 
-from slope_calculator import run
+import time
 
 
 def main() -> int:
     """Entrypoint used by the CLI and module execution."""
-    return run()
+    launch_time = time.perf_counter()
+    # Imported here so --debug-startup timings include loading the GUI module.
+    from slope_calculator import run
+
+    return run(launch_time)
 
 
 if __name__ == "__main__":
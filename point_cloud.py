@@ -0,0 +1,297 @@
+"""Streaming ingestion of XYZ point clouds into station profiles along an alignment."""
+
+import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from slope_kernel import profile_slopes
+
+TEXT_SUFFIXES = (".xyz", ".txt", ".csv", ".pts")
+
+
+def _iter_text_chunks(path, chunk_points, columns, delimiter, skiprows):
+    with open(path, encoding="utf-8") as handle:
+        for _ in range(skiprows):
+            next(handle, None)
+        while True:
+            lines = list(itertools.islice(handle, chunk_points))
+            if not lines:
+                return
+            lines = [line for line in lines if line.strip() and not line.lstrip().startswith("#")]
+            if lines:
+                yield np.loadtxt(lines, delimiter=delimiter, usecols=columns, ndmin=2, comments="#")
+
+
+def _iter_binary_chunks(path, chunk_points, columns, dtype, record_fields):
+    dtype = np.dtype(dtype)
+    with open(path, "rb") as handle:
+        while True:
+            chunk = np.fromfile(handle, dtype=dtype, count=chunk_points * record_fields)
+            if not chunk.size:
+                return
+            if chunk.size % record_fields:
+                raise ValueError(f"{path} ends with an incomplete record of {chunk.size % record_fields} values")
+            yield chunk.reshape(-1, record_fields)[:, list(columns)].astype(np.float64)
+
+
+def iter_xyz_chunks(
+    path,
+    chunk_points=1_000_000,
+    binary=None,
+    columns=(0, 1, 2),
+    delimiter=None,
+    skiprows=0,
+    dtype="<f8",
+    record_fields=3,
+):
+    """Yield ``(n, 3)`` float64 arrays of X, Y, Z with at most ``chunk_points`` rows each.
+
+    Text files (``.xyz``, ``.txt``, ``.csv``, ``.pts``) are parsed line by line;
+    anything else is read as flat binary records of ``record_fields`` values of
+    ``dtype``. Text chunks are counted in lines, so comment and blank lines make
+    a chunk smaller. ``binary`` overrides the suffix-based detection and ``columns``
+    picks the X, Y and Z fields of each record.
+    """
+    if chunk_points < 1:
+        raise ValueError("chunk_points must be positive")
+    path = Path(path)
+    if binary is None:
+        binary = path.suffix.lower() not in TEXT_SUFFIXES
+    if binary:
+        return _iter_binary_chunks(path, chunk_points, columns, dtype, record_fields)
+    if delimiter is None and path.suffix.lower() == ".csv":
+        delimiter = ","
+    return _iter_text_chunks(path, chunk_points, columns, delimiter, skiprows)
+
+
+class Alignment:
+    """Plan polyline with a corridor; points are projected onto it to obtain chainage and offset.
+
+    Only points within ``corridor_width / 2`` of the polyline, and not before its
+    start or past its end, receive a chainage. A uniform grid of cells covering
+    the corridor maps every cell to the segments that can reach it, so each
+    point is tested only against nearby segments.
+    """
+
+    def __init__(self, vertices, corridor_width):
+        vertices = np.asarray(vertices, dtype=np.float64)
+        if vertices.ndim != 2 or vertices.shape[1] != 2 or len(vertices) < 2:
+            raise ValueError("alignment needs at least two (x, y) vertices")
+        if not corridor_width > 0 or not math.isfinite(corridor_width):
+            raise ValueError("corridor_width must be a positive finite distance")
+        self.vertices = vertices
+        self.corridor_width = float(corridor_width)
+        self._starts = vertices[:-1]
+        self._vectors = np.diff(vertices, axis=0)
+        lengths = np.hypot(self._vectors[:, 0], self._vectors[:, 1])
+        if not np.all(lengths > 0):
+            raise ValueError("alignment contains repeated consecutive vertices")
+        self._lengths = lengths
+        self._start_chainage = np.concatenate([[0.0], np.cumsum(lengths)[:-1]])
+        self.length = float(lengths.sum())
+        self._build_index()
+
+    def _build_index(self):
+        half_width = self.corridor_width / 2
+        cell = max(self.corridor_width, self.length / 100_000)
+        # Samples are at most one cell apart, so the foot point of any corridor point
+        # lies within half a cell of a sample and the point within ``reach`` cells of it.
+        reach = int(math.ceil((half_width + cell / 2) / cell))
+        origin = self.vertices.min(axis=0) - (reach + 1) * cell
+        shape = np.ceil((self.vertices.max(axis=0) + (reach + 1) * cell - origin) / cell).astype(np.int64)
+
+        samples_per_segment = np.ceil(self._lengths / cell).astype(np.int64) + 1
+        segment = np.repeat(np.arange(len(self._lengths)), samples_per_segment)
+        first_sample = np.repeat(np.cumsum(samples_per_segment) - samples_per_segment, samples_per_segment)
+        fraction = (np.arange(segment.size) - first_sample) / (samples_per_segment[segment] - 1)
+        samples = self._starts[segment] + fraction[:, None] * self._vectors[segment]
+        sample_cells = np.floor((samples - origin) / cell).astype(np.int64)
+
+        steps = np.arange(-reach, reach + 1)
+        step_x, step_y = (grid.ravel() for grid in np.meshgrid(steps, steps))
+        keys = (sample_cells[:, 0, None] + step_x) * shape[1] + (sample_cells[:, 1, None] + step_y)
+        pairs = np.unique(keys.ravel() * len(self._lengths) + np.repeat(segment, step_x.size))
+        cell_keys = pairs // len(self._lengths)
+
+        self._cell = cell
+        self._origin = origin
+        self._shape = shape
+        self._cell_keys, self._cell_offsets, self._cell_counts = np.unique(
+            cell_keys, return_index=True, return_counts=True
+        )
+        self._cell_segments = pairs % len(self._lengths)
+
+    def _candidates(self, x, y):
+        """Return (point index, segment index) pairs for points in indexed cells."""
+        finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        ix = np.floor((x[finite] - self._origin[0]) / self._cell)
+        iy = np.floor((y[finite] - self._origin[1]) / self._cell)
+        on_grid = (ix >= 0) & (ix < self._shape[0]) & (iy >= 0) & (iy < self._shape[1])
+        finite = finite[on_grid]
+        keys = ix[on_grid].astype(np.int64) * self._shape[1] + iy[on_grid].astype(np.int64)
+        position = np.searchsorted(self._cell_keys, keys)
+        position[position == len(self._cell_keys)] = 0
+        indexed = self._cell_keys[position] == keys
+        points, position = finite[indexed], position[indexed]
+
+        counts = self._cell_counts[position]
+        pair_point = np.repeat(points, counts)
+        within_cell = np.arange(pair_point.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_segment = self._cell_segments[np.repeat(self._cell_offsets[position], counts) + within_cell]
+        return pair_point, pair_segment
+
+    def project(self, x, y):
+        """Return chainage and signed distance (left positive) of each point to the nearest segment.
+
+        Points outside the corridor or beyond either end of the alignment get NaN.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        chainage = np.full(x.shape, np.nan)
+        offset = np.full(x.shape, np.nan)
+        point, segment = self._candidates(x.ravel(), y.ravel())
+
+        start = self._starts[segment]
+        vector = self._vectors[segment]
+        length = self._lengths[segment]
+        dx = x.ravel()[point] - start[:, 0]
+        dy = y.ravel()[point] - start[:, 1]
+        along = (dx * vector[:, 0] + dy * vector[:, 1]) / length
+        before_start = (segment == 0) & (along < 0)
+        past_end = (segment == len(self._lengths) - 1) & (along > length)
+        along = np.clip(along, 0.0, length)
+        across = (vector[:, 0] * dy - vector[:, 1] * dx) / length
+        foot_x = dx - along * vector[:, 0] / length
+        foot_y = dy - along * vector[:, 1] / length
+        distance = foot_x * foot_x + foot_y * foot_y
+        distance[before_start | past_end | (distance > (self.corridor_width / 2) ** 2)] = np.inf
+
+        order = np.lexsort((distance, point))
+        nearest = order[np.r_[True, point[order][1:] != point[order][:-1]]] if order.size else order
+        nearest = nearest[np.isfinite(distance[nearest])]
+        chainage.ravel()[point[nearest]] = self._start_chainage[segment[nearest]] + along[nearest]
+        offset.ravel()[point[nearest]] = np.copysign(np.sqrt(distance[nearest]), across[nearest])
+        return chainage, offset
+
+
+class StationBins:
+    """Per-station chainage and elevation sums and point counts, merged across chunks and workers.
+
+    Stations report the mean chainage of their points rather than the nominal
+    ``k * station_spacing``, so half-width end bins and a last station that
+    overlaps the end of the alignment still sit where their points are.
+    """
+
+    def __init__(self, station_spacing, station_count):
+        if station_spacing <= 0:
+            raise ValueError("station_spacing must be positive")
+        self.station_spacing = float(station_spacing)
+        self.chainage_sums = np.zeros(station_count, dtype=np.float64)
+        self.sums = np.zeros(station_count, dtype=np.float64)
+        self.counts = np.zeros(station_count, dtype=np.int64)
+
+    @classmethod
+    def for_alignment(cls, alignment, station_spacing):
+        return cls(station_spacing, int(math.floor(alignment.length / station_spacing + 0.5)) + 1)
+
+    def add(self, chainage, elevation):
+        """Bin points to the nearest station (each station owns +/- half a spacing)."""
+        chainage = np.asarray(chainage, dtype=np.float64)
+        elevation = np.asarray(elevation, dtype=np.float64)
+        finite = np.isfinite(chainage) & np.isfinite(elevation)
+        index = np.floor(chainage[finite] / self.station_spacing + 0.5).astype(np.int64)
+        size = len(self.counts)
+        inside = (index >= 0) & (index < size)
+        self.chainage_sums += np.bincount(index[inside], weights=chainage[finite][inside], minlength=size)
+        self.sums += np.bincount(index[inside], weights=elevation[finite][inside], minlength=size)
+        self.counts += np.bincount(index[inside], minlength=size)
+
+    def merge(self, other):
+        self.chainage_sums += other.chainage_sums
+        self.sums += other.sums
+        self.counts += other.counts
+        return self
+
+    def profile(self, keep_empty=False):
+        """Return a ``StationProfile`` of mean chainages and elevations.
+
+        Empty stations are dropped unless ``keep_empty``, in which case they keep
+        their nominal chainage and a NaN elevation.
+        """
+        filled = self.counts > 0
+        chainage = np.arange(len(self.counts)) * self.station_spacing
+        with np.errstate(divide="ignore", invalid="ignore"):
+            chainage = np.where(filled, self.chainage_sums / self.counts, chainage)
+            elevation = self.sums / self.counts
+        if not keep_empty:
+            chainage, elevation, counts = chainage[filled], elevation[filled], self.counts[filled]
+        else:
+            counts = self.counts.copy()
+        return StationProfile(chainage, elevation, counts)
+
+
+class StationProfile:
+    """Station chainages with their binned elevations, ready for the slope kernel."""
+
+    def __init__(self, chainage, elevation, point_counts):
+        self.chainage = chainage
+        self.elevation = elevation
+        self.point_counts = point_counts
+
+    def __len__(self):
+        return len(self.chainage)
+
+    def slopes(self, **kernel_options):
+        """Return segment slopes between consecutive stations via ``slope_kernel.profile_slopes``."""
+        return profile_slopes(self.chainage, self.elevation, **kernel_options)
+
+
+def bin_chunk(points, alignment, station_spacing):
+    """Project one ``(n, 3)`` chunk onto ``alignment`` and return its ``StationBins``."""
+    bins = StationBins.for_alignment(alignment, station_spacing)
+    chainage, _ = alignment.project(points[:, 0], points[:, 1])
+    bins.add(chainage, points[:, 2])
+    return bins
+
+
+def ingest_point_cloud(
+    path,
+    alignment,
+    station_spacing,
+    corridor_width,
+    chunk_points=1_000_000,
+    workers=0,
+    keep_empty=False,
+    **read_options,
+):
+    """Stream an XYZ file into a ``StationProfile`` along ``alignment``.
+
+    Points are read ``chunk_points`` at a time and projected onto the alignment.
+    Only points within ``corridor_width / 2`` of it and between its ends are
+    averaged per station every ``station_spacing`` metres. With ``workers`` > 0
+    chunks are binned in that many processes; at most two chunks per worker are
+    in flight, so memory stays bounded by the chunk size either way.
+    ``read_options`` are passed to ``iter_xyz_chunks``.
+    """
+    vertices = alignment.vertices if isinstance(alignment, Alignment) else alignment
+    if not isinstance(alignment, Alignment) or alignment.corridor_width != corridor_width:
+        alignment = Alignment(vertices, corridor_width)
+    chunks = iter_xyz_chunks(path, chunk_points=chunk_points, **read_options)
+    total = StationBins.for_alignment(alignment, station_spacing)
+    if not workers:
+        for points in chunks:
+            total.merge(bin_chunk(points, alignment, station_spacing))
+        return total.profile(keep_empty)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for points in chunks:
+            pending.append(executor.submit(bin_chunk, points, alignment, station_spacing))
+            if len(pending) >= 2 * workers:
+                total.merge(pending.pop(0).result())
+        for future in pending:
+            total.merge(future.result())
+    return total.profile(keep_empty)
@@ -1,8 +1,8 @@
+import os
 import sys
+import time
 from contextlib import suppress
 
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D  # noqa: F401  # Required for 3D projection registration
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
@@ -22,9 +22,44 @@ from PyQt6.QtWidgets import (
 )
 
 
-def compute_slope(distance, h1, h2):
-    """Compute the slope percentage between two heights over a horizontal distance."""
-    return ((h2 - h1) / distance) * 100 if distance != 0 else float("inf")
+STARTUP_DEBUG_FLAG = "--debug-startup"
+STARTUP_DEBUG_ENV = "SLOPE_CALCULATOR_DEBUG_STARTUP"
+
+
+def load_pyplot(projection_3d=False):
+    """Import pyplot on first use so the window can paint before matplotlib loads."""
+    import matplotlib.pyplot as plt
+
+    if projection_3d:
+        from mpl_toolkits.mplot3d import Axes3D  # noqa: F401  # Required for 3D projection registration
+    return plt
+
+
+def compute_slope(distance, h1, h2, zero_distance="inf"):
+    """Compute the slope percentage between two heights over a horizontal distance.
+
+    ``zero_distance`` selects the result for a zero distance: ``"inf"`` (always
+    +inf), ``"signed"`` (IEEE division: +/-inf following the signs of the rise
+    and of a signed zero distance, NaN when the heights are equal or NaN),
+    ``"nan"`` or ``"raise"``. The array kernel in ``slope_kernel`` uses
+    the same policy names.
+    """
+    if distance != 0:
+        return ((h2 - h1) / distance) * 100
+    if zero_distance == "inf":
+        return float("inf")
+    if zero_distance == "signed":
+        import math
+
+        rise = h2 - h1
+        if math.isnan(rise) or rise == 0:
+            return float("nan")
+        return math.copysign(float("inf"), rise) * math.copysign(1.0, distance)
+    if zero_distance == "nan":
+        return float("nan")
+    if zero_distance == "raise":
+        raise ZeroDivisionError("horizontal distance is zero")
+    raise ValueError(f"unknown zero_distance policy: {zero_distance!r}")
 
 
 class ModernStyledWindow(QWidget):
@@ -348,6 +383,7 @@ class SlopeCalculator(ModernStyledWindow):
         self.last_result_value = None
         self.current_view_mode = "2d"
         self.current_figure = None
+        self.first_paint_callback = None
 
         self.setGeometry(100, 100, 520, 420)
         self.last_inputs = None
@@ -443,6 +479,12 @@ class SlopeCalculator(ModernStyledWindow):
         self.apply_language()
         self.apply_theme()
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.first_paint_callback is not None:
+            callback, self.first_paint_callback = self.first_paint_callback, None
+            callback()
+
     def calculate_slope(self):
         try:
             h_distance = float(self.input_distance.text())
@@ -466,6 +508,8 @@ class SlopeCalculator(ModernStyledWindow):
     def plot_graph(self, distance, h1, h2, slope):
         texts = self.translations[self.current_language]
         style = "dark_background" if self.current_theme == "dark" else "default"
+        plt = load_pyplot()
+        from slope_classes import segment_line_collection
 
         with plt.style.context(style):
             fig, ax = plt.subplots(figsize=(6, 4))
@@ -486,15 +530,16 @@ class SlopeCalculator(ModernStyledWindow):
                 linewidth=2,
                 label=texts["plot_legend_height"],
             )
-            ax.plot(
-                [0, distance],
-                [h1, h2],
-                marker="o",
-                linestyle="-",
-                color="#4d96ff",
-                linewidth=2,
-                label=texts["plot_legend_slope"],
+            ax.add_collection(
+                segment_line_collection(
+                    [0, distance],
+                    [h1, h2],
+                    linewidth=2,
+                    label=texts["plot_legend_slope"],
+                )
             )
+            ax.plot([0, distance], [h1, h2], marker="o", linestyle="none", color="#4d96ff")
+            ax.autoscale_view()
 
             ax.set_xlabel(texts["plot_distance_label"])
             ax.set_ylabel(texts["plot_height_label"])
@@ -532,6 +577,7 @@ class SlopeCalculator(ModernStyledWindow):
     def plot_3d_graph(self, distance, h1, h2, slope):
         texts = self.translations[self.current_language]
         style = "dark_background" if self.current_theme == "dark" else "default"
+        plt = load_pyplot(projection_3d=True)
 
         with plt.style.context(style):
             fig = plt.figure(figsize=(6, 4))
@@ -595,7 +641,7 @@ class SlopeCalculator(ModernStyledWindow):
     def _close_current_figure(self):
         if self.current_figure is not None:
             with suppress(Exception):
-                plt.close(self.current_figure)
+                load_pyplot().close(self.current_figure)
             self.current_figure = None
 
     def _register_figure(self, figure):
@@ -649,7 +695,9 @@ class SlopeCalculator(ModernStyledWindow):
         self.update_view3d_button_state(texts)
 
     def apply_theme(self):
-        self.setStyleSheet(self.load_styles(self.current_theme))
+        styles = self.load_styles(self.current_theme)
+        if self.styleSheet() != styles:
+            self.setStyleSheet(styles)
 
     def load_styles(self, theme="light"):
         return self.theme_styles.get(theme, self.theme_styles["light"])
@@ -672,10 +720,62 @@ class SlopeCalculator(ModernStyledWindow):
                 self.view3d_button.setToolTip(texts["view_3d_enabled_tooltip"])
 
 
-def run():
-    """Launch the slope calculator application."""
-    app = QApplication(sys.argv)
+class StartupProfiler:
+    """Collect wall-clock marks from ``launch_time`` to the first window paint.
+
+    ``launch_time`` is a ``time.perf_counter()`` value taken by the entry point
+    before this module is imported. Interpreter startup before that point is not
+    included; ``python -X importtime`` reports it.
+    """
+
+    def __init__(self, launch_time=None, stream=None):
+        self._stream = stream if stream is not None else sys.stderr
+        launch_time = time.perf_counter() if launch_time is None else launch_time
+        self._marks = [("launched", launch_time)]
+
+    def mark(self, label):
+        self._marks.append((label, time.perf_counter()))
+
+    def report(self):
+        origin = self._marks[0][1]
+        previous = origin
+        for label, timestamp in self._marks:
+            total_ms = (timestamp - origin) * 1000
+            step_ms = (timestamp - previous) * 1000
+            print(f"[startup] {label:<24} {total_ms:9.1f} ms (+{step_ms:.1f} ms)", file=self._stream)
+            previous = timestamp
+        deferred = [name for name in ("matplotlib", "mpl_toolkits.mplot3d") if name not in sys.modules]
+        print(f"[startup] deferred modules: {', '.join(deferred) or 'none'}", file=self._stream)
+        self._stream.flush()
+
+
+def startup_debug_enabled(argv=None):
+    """Return True when startup timing was requested via flag or environment."""
+    argv = sys.argv if argv is None else argv
+    return STARTUP_DEBUG_FLAG in argv or os.environ.get(STARTUP_DEBUG_ENV, "") not in ("", "0")
+
+
+def run(launch_time=None):
+    """Launch the slope calculator application.
+
+    ``launch_time`` is the ``time.perf_counter()`` value the startup timings are
+    measured from; it defaults to the moment ``run()`` is called.
+    """
+    profiler = StartupProfiler(launch_time) if startup_debug_enabled() else None
+    if profiler is not None:
+        profiler.mark("run() entered")
+    app = QApplication([arg for arg in sys.argv if arg != STARTUP_DEBUG_FLAG])
+    if profiler is not None:
+        profiler.mark("QApplication created")
     win = SlopeCalculator()
+    if profiler is not None:
+        profiler.mark("window constructed")
+
+        def on_first_paint():
+            profiler.mark("first paint")
+            profiler.report()
+
+        win.first_paint_callback = on_first_paint
     win.show()
     return app.exec()
 
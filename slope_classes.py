@@ -0,0 +1,141 @@
+"""Classification of slope results into compliance bands with per-class summaries."""
+
+import numpy as np
+
+from slope_kernel import profile_slopes
+
+SLOPE_CLASS_NAMES = ("accessible", "ramp", "steep", "critical")
+# Upper bounds (inclusive, absolute percent) of every class except the last one.
+DEFAULT_THRESHOLDS = (5.0, 8.33, 15.0)
+SLOPE_CLASS_COLORS = ("#43a047", "#fbc02d", "#fb8c00", "#e53935")
+UNCLASSIFIED = -1
+
+
+def classify_slopes(slopes, thresholds=DEFAULT_THRESHOLDS):
+    """Return an int8 class code per slope percentage; NaN slopes map to UNCLASSIFIED."""
+    magnitudes = np.abs(np.asarray(slopes, dtype=np.float64))
+    codes = np.searchsorted(np.asarray(thresholds, dtype=np.float64), magnitudes, side="left")
+    codes = codes.astype(np.int8)
+    codes[np.isnan(magnitudes)] = UNCLASSIFIED
+    return codes
+
+
+class SlopeClassHistogram:
+    """Running count and length/area per slope class, fed one batch at a time."""
+
+    def __init__(self, thresholds=DEFAULT_THRESHOLDS, names=SLOPE_CLASS_NAMES):
+        if len(names) != len(thresholds) + 1:
+            raise ValueError("names must contain one entry more than thresholds")
+        self.thresholds = tuple(thresholds)
+        self.names = tuple(names)
+        self.counts = np.zeros(len(self.names), dtype=np.int64)
+        self.totals = np.zeros(len(self.names), dtype=np.float64)
+        self.unclassified = 0
+
+    def update(self, slopes, weights=None):
+        """Add a batch of slopes, each weighted by its length or area (default 1)."""
+        self.add_codes(classify_slopes(slopes, self.thresholds), weights)
+
+    def add_codes(self, codes, weights=None):
+        """Add a batch of already classified codes, e.g. reused from ``classify_slopes``."""
+        codes = np.ravel(codes)
+        valid = codes != UNCLASSIFIED
+        self.unclassified += int(codes.size - np.count_nonzero(valid))
+        if weights is not None:
+            weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), np.shape(codes))[valid]
+        codes = codes[valid]
+        minlength = len(self.names)
+        self.counts += np.bincount(codes, minlength=minlength)
+        self.totals += np.bincount(codes, weights=weights, minlength=minlength)
+
+    def merge(self, other):
+        """Fold another histogram with the same thresholds into this one."""
+        if other.thresholds != self.thresholds:
+            raise ValueError("cannot merge histograms with different thresholds")
+        self.counts += other.counts
+        self.totals += other.totals
+        self.unclassified += other.unclassified
+        return self
+
+    def summary(self):
+        """Return ``{class name: {"count", "total", "share"}}`` for every class."""
+        grand_total = self.totals.sum()
+        return {
+            name: {
+                "count": int(count),
+                "total": float(total),
+                "share": float(total / grand_total) if grand_total else 0.0,
+            }
+            for name, count, total in zip(self.names, self.counts, self.totals)
+        }
+
+
+def profile_segment_slopes(chainage, elevation, **kernel_options):
+    """Return the slope percentage and horizontal length of every profile segment.
+
+    Slopes come from ``slope_kernel.profile_slopes``; ``kernel_options`` select
+    its precision, re-centring and zero-distance/invalid policies.
+    """
+    slopes = profile_slopes(chainage, elevation, **kernel_options)
+    return slopes, np.abs(np.diff(np.asarray(chainage, dtype=np.float64)))
+
+
+def classify_profile(chainage, elevation, thresholds=DEFAULT_THRESHOLDS, **kernel_options):
+    """Classify every segment of a profile; returns class codes and the length histogram."""
+    slopes, lengths = profile_segment_slopes(chainage, elevation, **kernel_options)
+    codes = classify_slopes(slopes, thresholds)
+    histogram = SlopeClassHistogram(thresholds)
+    histogram.add_codes(codes, lengths)
+    return codes, histogram
+
+
+def grid_slopes(dem, cell_size):
+    """Return the steepest-descent slope percentage of every grid cell."""
+    d_row, d_col = np.gradient(np.asarray(dem, dtype=np.float64), cell_size)
+    return np.hypot(d_row, d_col) * 100
+
+
+def classify_grid(dem, cell_size, thresholds=DEFAULT_THRESHOLDS, chunk_rows=1024, nodata=None, out=None):
+    """Classify an elevation grid in row chunks and return the area histogram.
+
+    ``dem`` may be an ``np.memmap``; only ``chunk_rows`` rows plus a one-row halo
+    are read at a time. When ``out`` is given (for example another memmap of the
+    same shape) the class codes are written into it chunk by chunk.
+    """
+    rows = dem.shape[0]
+    if dem.ndim != 2 or rows < 2 or dem.shape[1] < 2:
+        raise ValueError("dem must be a 2D grid with at least 2 rows and 2 columns")
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be positive")
+    histogram = SlopeClassHistogram(thresholds)
+    cell_area = float(cell_size) ** 2
+    for start in range(0, rows, chunk_rows):
+        stop = min(start + chunk_rows, rows)
+        halo_start = max(start - 1, 0)
+        halo_stop = min(stop + 1, rows)
+        block = np.array(dem[halo_start:halo_stop], dtype=np.float64)
+        if nodata is not None:
+            block[block == nodata] = np.nan
+        slopes = grid_slopes(block, cell_size)[start - halo_start : stop - halo_start]
+        codes = classify_slopes(slopes, thresholds)
+        histogram.add_codes(codes, cell_area)
+        if out is not None:
+            out[start:stop] = codes
+    return histogram
+
+
+def segment_line_collection(
+    chainage, elevation, thresholds=DEFAULT_THRESHOLDS, colors=SLOPE_CLASS_COLORS, kernel_options=None, **kwargs
+):
+    """Build one matplotlib ``LineCollection`` with every segment coloured by slope class.
+
+    ``kernel_options`` is passed to ``profile_segment_slopes``; ``kwargs`` to ``LineCollection``.
+    """
+    from matplotlib.collections import LineCollection
+
+    points = np.column_stack([np.asarray(chainage, dtype=np.float64), np.asarray(elevation, dtype=np.float64)])
+    segments = np.stack([points[:-1], points[1:]], axis=1)
+    slopes, _ = profile_segment_slopes(points[:, 0], points[:, 1], **(kernel_options or {}))
+    codes = classify_slopes(slopes, thresholds)
+    palette = np.array(tuple(colors) + ("#9e9e9e",))
+    return LineCollection(segments, colors=palette[codes].tolist(), **kwargs)
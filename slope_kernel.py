@@ -0,0 +1,192 @@
+"""Vectorised slope kernel with selectable precision and explicit zero-distance handling."""
+
+import warnings
+
+import numpy as np
+
+PRECISIONS = {"float32": np.float32, "float64": np.float64}
+# inf: legacy behaviour of compute_slope, +inf for every zero run (also 0/0).
+# signed: IEEE semantics, +/-inf following the rise and NaN for a flat zero-length run.
+# nan: NaN for every zero run.
+# raise: ZeroDivisionError if any run is zero.
+ZERO_DISTANCE_POLICIES = ("inf", "signed", "nan", "raise")
+INVALID_POLICIES = ("propagate", "raise")
+
+
+def _resolve_precision(precision):
+    try:
+        return PRECISIONS[precision]
+    except KeyError:
+        raise ValueError(f"precision must be one of {sorted(PRECISIONS)}, got {precision!r}") from None
+
+
+def _split(values, dtype, compensated):
+    """Cast ``values`` to ``dtype``; when compensated also return the rounding residual."""
+    high = values.astype(dtype, copy=False)
+    if not compensated or dtype is np.float64:
+        return high, None
+    return high, (values - high).astype(dtype)
+
+
+def _difference(start, end):
+    """Return ``end - start`` for ``(high, low)`` pairs produced by ``_split``."""
+    result = end[0] - start[0]
+    if start[1] is not None:
+        result += end[1] - start[1]
+    return result
+
+
+def _profile_difference(parts):
+    """Return consecutive differences of a ``(high, low)`` pair produced by ``_split``."""
+    high, low = parts
+    result = np.diff(high)
+    if low is not None:
+        result += np.diff(low)
+    return result
+
+
+def _origin(*arrays):
+    """Return the first finite value of the given arrays, used as the re-centring origin."""
+    for values in arrays:
+        for chunk_start in range(0, values.size, 4096):
+            chunk = values.ravel()[chunk_start : chunk_start + 4096]
+            finite = np.flatnonzero(np.isfinite(chunk))
+            if finite.size:
+                return chunk[finite[0]]
+    return None
+
+
+def _collapsed_runs(run, zero_run, exact):
+    """Return indices and float64 slopes of runs that only became zero through the cast."""
+    if exact is None or run.dtype == np.float64:
+        return None
+    candidates = np.flatnonzero(zero_run)
+    if not candidates.size:
+        return None
+    exact_rise, exact_run = exact(candidates)
+    collapsed = exact_run != 0
+    if not collapsed.any():
+        return None
+    warnings.warn(
+        f"{int(collapsed.sum())} non-zero horizontal distance(s) underflowed to zero in {run.dtype}; "
+        "their slopes were recomputed in float64",
+        RuntimeWarning,
+        stacklevel=4,
+    )
+    index = candidates[collapsed]
+    return index, exact_rise[collapsed] / exact_run[collapsed] * 100
+
+
+def _divide(rise, run, zero_distance, invalid, exact=None):
+    """Divide with the zero-distance policy applied; ``exact(index)`` returns float64 (rise, run)."""
+    if zero_distance not in ZERO_DISTANCE_POLICIES:
+        raise ValueError(f"zero_distance must be one of {ZERO_DISTANCE_POLICIES}, got {zero_distance!r}")
+    if invalid not in INVALID_POLICIES:
+        raise ValueError(f"invalid must be one of {INVALID_POLICIES}, got {invalid!r}")
+    if invalid == "raise" and not (np.isfinite(rise).all() and np.isfinite(run).all()):
+        raise ValueError("input contains NaN or infinite values")
+
+    zero_run = run == 0
+    fixups = _collapsed_runs(run, zero_run, exact)
+    if fixups is not None:
+        zero_run = np.array(zero_run)
+        zero_run.flat[fixups[0]] = False
+    if zero_distance == "raise" and zero_run.any():
+        raise ZeroDivisionError(f"zero horizontal distance at index {np.flatnonzero(zero_run)[:5].tolist()}")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = rise / run * run.dtype.type(100)
+    if zero_distance == "inf":
+        slopes = np.where(zero_run, np.inf, slopes)
+    elif zero_distance == "nan":
+        slopes = np.where(zero_run, np.nan, slopes)
+    if fixups is not None:
+        slopes = np.array(slopes)
+        with np.errstate(over="ignore"):
+            slopes.flat[fixups[0]] = fixups[1]
+    return slopes
+
+
+def _prepare(values, dtype, widen):
+    return np.asarray(values, dtype=np.float64 if widen else dtype)
+
+
+def _recenter(origin, *arrays):
+    if origin is None:
+        return arrays
+    return tuple(values - origin for values in arrays)
+
+
+def compute_slopes(
+    distance, h1, h2, precision="float64", compensated=False, recenter=True, zero_distance="inf", invalid="propagate"
+):
+    """Array version of ``compute_slope``: slope percentage between ``h1`` and ``h2`` over ``distance``.
+
+    ``precision`` selects the working dtype. With ``compensated`` the heights are
+    split into a high and a low part of the working dtype before differencing,
+    which keeps float32 results accurate for large absolute elevations.
+    ``recenter`` subtracts a common origin in float64 before the cast.
+
+    ``compute_slopes`` and ``profile_slopes`` share their defaults: float64,
+    re-centred, ``zero_distance="inf"`` as in ``compute_slope`` and
+    ``invalid="propagate"``.
+    """
+    dtype = _resolve_precision(precision)
+    widen = compensated or recenter
+    source = np.broadcast_arrays(np.asarray(distance), np.asarray(h1), np.asarray(h2))
+    h1 = _prepare(h1, dtype, widen)
+    h2 = _prepare(h2, dtype, widen)
+    if recenter:
+        h1, h2 = _recenter(_origin(h1, h2), h1, h2)
+    rise = _difference(_split(h1, dtype, compensated), _split(h2, dtype, compensated))
+    run = np.asarray(distance, dtype=dtype)
+    rise, run = np.broadcast_arrays(rise, run)
+
+    def exact(index):
+        source_run, source_h1, source_h2 = (values.flat[index].astype(np.float64) for values in source)
+        return source_h2 - source_h1, source_run
+
+    return _divide(rise, run, zero_distance, invalid, exact)
+
+
+def profile_slopes(
+    chainage,
+    elevation,
+    precision="float64",
+    compensated=False,
+    recenter=True,
+    zero_distance="inf",
+    invalid="propagate",
+):
+    """Return the slope percentage of every segment of a profile.
+
+    ``chainage`` and ``elevation`` are station coordinates, e.g. survey northings
+    in the millions of metres. By default each axis is re-centred on its first
+    finite value in float64 before the values are cast to ``precision`` and
+    differenced; ``compensated`` additionally carries the float32 rounding error
+    as a low part. Zero-distance policies apply only to runs that are zero in
+    the input: a float32 run that rounds to zero is recomputed in float64 with a
+    ``RuntimeWarning``. Defaults match ``compute_slopes``, so a zero-length
+    segment gives +inf like ``compute_slope`` unless another ``zero_distance``
+    policy is chosen.
+    """
+    dtype = _resolve_precision(precision)
+    widen = compensated or recenter
+    source_chainage = np.asarray(chainage)
+    source_elevation = np.asarray(elevation)
+    chainage = _prepare(chainage, dtype, widen)
+    elevation = _prepare(elevation, dtype, widen)
+    if chainage.shape != elevation.shape or chainage.ndim != 1:
+        raise ValueError("chainage and elevation must be 1D arrays of equal length")
+    if recenter:
+        (chainage,) = _recenter(_origin(chainage), chainage)
+        (elevation,) = _recenter(_origin(elevation), elevation)
+    run = _profile_difference(_split(chainage, dtype, compensated))
+    rise = _profile_difference(_split(elevation, dtype, compensated))
+
+    def exact(index):
+        def step(values):
+            return values[index + 1].astype(np.float64) - values[index].astype(np.float64)
+
+        return step(source_elevation), step(source_chainage)
+
+    return _divide(rise, run, zero_distance, invalid, exact)
@@ -0,0 +1,121 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from point_cloud import Alignment, ingest_point_cloud, iter_xyz_chunks  # noqa: E402
+
+
+def make_points(count=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    chainage = rng.uniform(0, 20, count)
+    # Right-hand side only: points inside the corner would be nearer the other leg.
+    offset = rng.uniform(-1, 0, count)
+    # L-shaped alignment: 10 m east, then 10 m north, at survey-scale coordinates.
+    x = np.where(chainage < 10, 500_000 + chainage, 500_010 - offset)
+    y = np.where(chainage < 10, 4_000_000 + offset, 4_000_000 + chainage - 10)
+    z = 100 + 0.05 * chainage
+    return np.column_stack([x, y, z])
+
+
+ALIGNMENT = [(500_000, 4_000_000), (500_010, 4_000_000), (500_010, 4_000_010)]
+
+
+def test_alignment_project_returns_chainage_and_signed_offset():
+    chainage, offset = Alignment(ALIGNMENT, 5).project([500_004, 500_012], [4_000_001, 4_000_007])
+    np.testing.assert_allclose(chainage, [4, 17])
+    np.testing.assert_allclose(offset, [1, -2])
+
+
+def test_alignment_project_drops_points_outside_corridor_and_past_ends():
+    x = [500_005, 499_998, 500_010, 500_005, 500_009]
+    y = [4_000_050, 4_000_000, 4_000_013, 4_000_000.5, 3_999_999]
+    chainage, offset = Alignment(ALIGNMENT, 2).project(x, y)
+    assert np.isnan(chainage[:3]).all() and np.isnan(offset[:3]).all()
+    np.testing.assert_allclose(chainage[3:], [5, 9])
+
+
+def test_alignment_index_matches_brute_force():
+    rng = np.random.default_rng(3)
+    angles = np.linspace(0, 6 * np.pi, 60)
+    vertices = np.column_stack([500_000 + angles * 40, 4_000_000 + np.sin(angles) * 80])
+    x = rng.uniform(vertices[:, 0].min() - 20, vertices[:, 0].max() + 20, 5000)
+    y = rng.uniform(vertices[:, 1].min() - 20, vertices[:, 1].max() + 20, 5000)
+    alignment = Alignment(vertices, 16)
+    chainage, offset = alignment.project(x, y)
+
+    expected = np.full(x.shape, np.inf)
+    last = len(vertices) - 2
+    for index, (start, end) in enumerate(zip(vertices[:-1], vertices[1:])):
+        vector = end - start
+        along = ((x - start[0]) * vector[0] + (y - start[1]) * vector[1]) / vector.dot(vector)
+        off_end = (along < 0) if index == 0 else (along > 1) if index == last else np.zeros(x.shape, bool)
+        along = np.clip(along, 0, 1)
+        distance = np.hypot(x - start[0] - along * vector[0], y - start[1] - along * vector[1])
+        expected = np.minimum(expected, np.where(off_end, np.inf, distance))
+    inside = expected <= 8
+    assert inside.any() and not inside.all()
+    np.testing.assert_array_equal(np.isfinite(chainage), inside)
+    np.testing.assert_allclose(np.abs(offset[inside]), expected[inside])
+
+
+def test_text_chunks_skip_comments(tmp_path):
+    path = tmp_path / "cloud.csv"
+    path.write_text("# x,y,z\n1,2,3\n\n4,5,6\n7,8,9\n", encoding="utf-8")
+    chunks = list(iter_xyz_chunks(path, chunk_points=2))
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    assert np.vstack(chunks).tolist() == [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+
+def test_binary_ingestion_matches_text_and_yields_slopes(tmp_path):
+    points = make_points()
+    binary_path = tmp_path / "cloud.bin"
+    points.astype("<f8").tofile(binary_path)
+    text_path = tmp_path / "cloud.xyz"
+    np.savetxt(text_path, points, fmt="%.6f")
+
+    from_binary = ingest_point_cloud(binary_path, ALIGNMENT, 2.0, corridor_width=2, chunk_points=300)
+    from_text = ingest_point_cloud(text_path, ALIGNMENT, 2.0, corridor_width=2, chunk_points=700)
+
+    assert len(from_binary) == 11
+    assert from_binary.point_counts.sum() == len(points)
+    np.testing.assert_allclose(from_binary.elevation, from_text.elevation, atol=1e-5)
+    np.testing.assert_allclose(from_binary.slopes(), 5.0, atol=1e-6)
+
+
+@pytest.mark.parametrize("station_spacing", [2.0, 3.0, 7.0])
+def test_stations_sit_at_mean_chainage_of_their_points(tmp_path, station_spacing):
+    # The 20 m alignment is not a multiple of 3 or 7, so the last bin overlaps its end.
+    path = tmp_path / "cloud.bin"
+    make_points(count=5000).tofile(path)
+
+    profile = ingest_point_cloud(path, ALIGNMENT, station_spacing, corridor_width=2, chunk_points=700, workers=0)
+
+    assert profile.chainage[0] > 0 and profile.chainage[-1] < 20
+    np.testing.assert_allclose(profile.slopes(), 5.0, atol=1e-6)
+
+
+def test_corridor_is_required_and_excludes_far_and_past_end_points(tmp_path):
+    points = make_points()
+    far_and_past_end = np.array([[500_005, 4_000_050, 500.0], [499_990, 4_000_000, 500.0], [500_010, 4_000_030, 500.0]])
+    path = tmp_path / "cloud.bin"
+    np.vstack([points, far_and_past_end]).tofile(path)
+
+    with pytest.raises(TypeError):
+        ingest_point_cloud(path, ALIGNMENT, 2.0)
+    profile = ingest_point_cloud(path, ALIGNMENT, 2.0, corridor_width=4)
+    assert profile.point_counts.sum() == len(points)
+    assert profile.elevation.max() < 102
+
+
+def test_corridor_and_workers(tmp_path):
+    points = make_points()
+    outlier = np.array([[500_005, 4_000_050, 500.0]])
+    path = tmp_path / "cloud.bin"
+    np.vstack([points, outlier]).tofile(path)
+
+    serial = ingest_point_cloud(path, ALIGNMENT, 2.0, corridor_width=4, chunk_points=500)
+    parallel = ingest_point_cloud(path, ALIGNMENT, 2.0, corridor_width=4, chunk_points=500, workers=2)
+
+    assert serial.point_counts.sum() == len(points)
+    np.testing.assert_array_equal(serial.point_counts, parallel.point_counts)
+    np.testing.assert_allclose(serial.elevation, parallel.elevation)
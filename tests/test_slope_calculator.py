@@ -32,3 +32,24 @@ def test_compute_slope_typical_negative_gradient():
 
 def test_compute_slope_zero_distance_returns_infinity():
     assert compute_slope(0, 3, 7) == float("inf")
+
+
+def test_plotting_backend_is_not_imported_at_module_level():
+    module_ast = ast.parse(MODULE_PATH.read_text(encoding="utf-8"))
+    top_level_modules = set()
+    for node in module_ast.body:
+        if isinstance(node, ast.Import):
+            top_level_modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            top_level_modules.add(node.module)
+    assert not any(name.startswith(("matplotlib", "mpl_toolkits")) for name in top_level_modules)
+
+
+def test_compute_slope_zero_distance_policies():
+    assert math.isnan(compute_slope(0, 5, 5, zero_distance="signed"))
+    assert compute_slope(0, 7, 3, zero_distance="signed") == float("-inf")
+    assert math.isnan(compute_slope(0, 3, 7, zero_distance="nan"))
+    assert math.isnan(compute_slope(0, float("nan"), 1, zero_distance="signed"))
+    assert math.isnan(compute_slope(0, 1, float("nan"), zero_distance="signed"))
+    assert compute_slope(-0.0, 3, 7, zero_distance="signed") == float("-inf")
+    assert compute_slope(-0.0, 7, 3, zero_distance="signed") == float("inf")
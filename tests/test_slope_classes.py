@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from slope_classes import (  # noqa: E402
+    UNCLASSIFIED,
+    SlopeClassHistogram,
+    classify_grid,
+    classify_profile,
+    classify_slopes,
+    grid_slopes,
+)
+
+
+def test_classify_slopes_thresholds_are_inclusive():
+    codes = classify_slopes([0.0, -5.0, 5.01, 8.33, 8.34, 15.0, 40.0, float("inf"), float("nan")])
+    assert codes.tolist() == [0, 0, 1, 1, 2, 2, 3, 3, UNCLASSIFIED]
+
+
+def test_classify_profile_sums_lengths_per_class():
+    codes, histogram = classify_profile([0, 10, 20, 30], [0, 0.4, 1.2, 4.2])
+    assert codes.tolist() == [0, 1, 3]
+    summary = histogram.summary()
+    assert math.isclose(summary["accessible"]["total"], 10.0)
+    assert math.isclose(summary["ramp"]["total"], 10.0)
+    assert summary["steep"]["count"] == 0
+    assert math.isclose(summary["critical"]["share"], 1 / 3)
+
+
+def test_streamed_histogram_matches_single_batch():
+    slopes = np.random.default_rng(0).normal(0, 10, 1000)
+    streamed = SlopeClassHistogram()
+    for batch in np.array_split(slopes, 7):
+        streamed.update(batch)
+    whole = SlopeClassHistogram()
+    whole.update(slopes)
+    assert streamed.counts.tolist() == whole.counts.tolist()
+
+
+def test_classify_grid_chunks_match_whole_grid(tmp_path):
+    dem = np.random.default_rng(1).normal(100, 2, (37, 23))
+    mapped = np.memmap(tmp_path / "dem.f64", dtype=np.float64, mode="w+", shape=dem.shape)
+    mapped[:] = dem
+    out = np.zeros(dem.shape, dtype=np.int8)
+
+    histogram = classify_grid(mapped, 5.0, chunk_rows=4, out=out)
+
+    expected = classify_slopes(grid_slopes(dem, 5.0))
+    assert out.tolist() == expected.tolist()
+    assert histogram.counts.sum() == dem.size
+    assert math.isclose(histogram.totals.sum(), dem.size * 25.0)
+
+
+def test_classify_profile_uses_kernel_zero_distance_policy():
+    codes, _ = classify_profile([0, 0, 10], [0, 0, 0.2])
+    assert codes.tolist() == [3, 0]
+    codes, _ = classify_profile([0, 0, 10], [0, 0, 0.2], zero_distance="signed")
+    assert codes.tolist() == [UNCLASSIFIED, 0]
+    with pytest.raises(ZeroDivisionError):
+        classify_profile([0, 0, 10], [0, 0, 0.2], zero_distance="raise")
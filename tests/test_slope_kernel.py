@@ -0,0 +1,55 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from slope_kernel import compute_slopes, profile_slopes  # noqa: E402
+
+
+def test_compute_slopes_matches_scalar_cases():
+    slopes = compute_slopes([10, 5, 0], [2, 10, 3], [4, 5, 7])
+    assert slopes.tolist() == [20.0, -100.0, float("inf")]
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [("inf", [math.inf, math.inf, math.inf]), ("signed", [math.inf, -math.inf, math.nan]), ("nan", [math.nan] * 3)],
+)
+def test_zero_distance_policies(policy, expected):
+    slopes = compute_slopes(0, [1, 4, 2], [3, 2, 2], zero_distance=policy)
+    np.testing.assert_array_equal(slopes, expected)
+
+
+def test_zero_distance_raise_and_invalid_raise():
+    with pytest.raises(ZeroDivisionError):
+        compute_slopes([1, 0], 0, 1, zero_distance="raise")
+    with pytest.raises(ValueError):
+        compute_slopes(1, [0, float("nan")], 1, invalid="raise")
+
+
+def test_float32_compensated_profile_keeps_millimetre_precision():
+    chainage = 4_000_000 + np.arange(0, 2, 0.001)
+    elevation = 100 + np.arange(chainage.size) * 0.0001
+    with pytest.warns(RuntimeWarning, match="underflowed"):
+        plain = profile_slopes(chainage, elevation, precision="float32", recenter=False)
+    compensated = profile_slopes(chainage, elevation, precision="float32", recenter=False, compensated=True)
+    assert compensated.dtype == np.float32
+    assert not np.allclose(plain, 10.0, rtol=1e-3)
+    np.testing.assert_allclose(compensated, 10.0, rtol=1e-3)
+    np.testing.assert_allclose(profile_slopes(chainage, elevation, precision="float32"), 10.0, rtol=1e-3)
+
+
+def test_float32_run_rounding_to_zero_is_not_a_zero_distance():
+    chainage = np.array([4_000_000.0, 4_000_000.001, 4_000_000.001])
+    elevation = np.array([100.0, 100.0001, 100.0002])
+    with pytest.warns(RuntimeWarning, match="underflowed"):
+        slopes = profile_slopes(chainage, elevation, precision="float32", recenter=False, zero_distance="nan")
+    np.testing.assert_allclose(slopes[0], 10.0, rtol=1e-3)
+    assert math.isnan(slopes[1])
+
+
+def test_profile_and_pairwise_kernels_share_defaults():
+    profile = profile_slopes([0, 0, 0], [1, 1, 2])
+    pairwise = compute_slopes([0, 0], [1, 1], [1, 2])
+    assert profile.tolist() == pairwise.tolist() == [math.inf, math.inf]